@@ -6,10 +6,17 @@ This creates a single source of truth by moving hardcoded data into the database
 """
 
 import sys
+from datetime import date
 from src.database.operations import DatabaseStorage
 from src.services.sync_service import TechnologySyncService, CategorySyncService
 from src.services.cached_queries import CachedQueryService
-from src.core.config import PLANNING_BLUEPRINT
+from src.core.config import (
+    BLUEPRINT_CATEGORIES,
+    BLUEPRINT_CATEGORY_ROWS,
+    BLUEPRINT_MAX_HOURS,
+    BLUEPRINT_MIN_HOURS,
+    BLUEPRINT_TOOL_NAMES,
+)
 import logging
 
 # Setup logging
@@ -32,8 +39,10 @@ def bootstrap_planning_blueprint():
     categories_skipped = 0
     technologies_skipped = 0
     
-    # Process each category in the blueprint
-    for category_name, category_data in PLANNING_BLUEPRINT.items():
+    date_added = str(date.today())
+    
+    # Process each category in the blueprint, reading its tools from the flat columns
+    for category_name, tool_rows in zip(BLUEPRINT_CATEGORIES, BLUEPRINT_CATEGORY_ROWS):
         print(f"\n📂 Processing category: {category_name}")
         
         # Add category as built-in (is_custom=0)
@@ -46,30 +55,25 @@ def bootstrap_planning_blueprint():
             categories_skipped += 1
             print(f"   ⏭️  Skipped (already exists): {category_name}")
         
-        # Process subsections and tools
-        for subsection in category_data.get('subsections', []):
-            subsection_name = subsection.get('name', '')
+        for row in tool_rows:
+            tech_name = BLUEPRINT_TOOL_NAMES[row]
+            # Use average of min and max hours as goal_hours
+            goal_hours = (BLUEPRINT_MIN_HOURS[row] + BLUEPRINT_MAX_HOURS[row]) / 2
+            
+            # Add technology using sync service
+            tech_result = tech_service.add_technology(
+                name=tech_name,
+                category=category_name,
+                goal_hours=goal_hours,
+                date_added=date_added
+            )
             
-            for tool in subsection.get('tools', []):
-                tech_name = tool['name']
-                # Use average of min and max hours as goal_hours
-                goal_hours = (tool['min_hours'] + tool['max_hours']) / 2
-                
-                # Add technology using sync service
-                from datetime import date
-                tech_result = tech_service.add_technology(
-                    name=tech_name,
-                    category=category_name,
-                    goal_hours=goal_hours,
-                    date_added=str(date.today())
-                )
-                
-                if tech_result['success']:
-                    technologies_added += 1
-                    print(f"      ✅ Added tech: {tech_name} ({goal_hours:.0f}h goal)")
-                else:
-                    technologies_skipped += 1
-                    print(f"      ⏭️  Skipped: {tech_name}")
+            if tech_result['success']:
+                technologies_added += 1
+                print(f"      ✅ Added tech: {tech_name} ({goal_hours:.0f}h goal)")
+            else:
+                technologies_skipped += 1
+                print(f"      ⏭️  Skipped: {tech_name}")
     
     # Invalidate cache to refresh all queries
     CachedQueryService.invalidate_cache()
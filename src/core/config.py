@@ -136,3 +136,31 @@ PLANNING_BLUEPRINT = {
         ]
     }
 }
+
+
+def _flatten_blueprint(blueprint):
+    """Walk the nested blueprint once into parallel per-tool columns.
+    
+    Returns (names, min_hours, max_hours, category_rows), where
+    category_rows[c] is the range of tool rows belonging to category c.
+    """
+    names, min_hours, max_hours, category_rows = [], [], [], []
+    for category_data in blueprint.values():
+        start = len(names)
+        for subsection in category_data.get("subsections", []):
+            for tool in subsection.get("tools", []):
+                names.append(tool["name"])
+                min_hours.append(tool["min_hours"])
+                max_hours.append(tool["max_hours"])
+        category_rows.append(range(start, len(names)))
+    return tuple(names), tuple(min_hours), tuple(max_hours), tuple(category_rows)
+
+
+# Struct-of-arrays view of the blueprint tools, built once at import
+BLUEPRINT_CATEGORIES = tuple(PLANNING_BLUEPRINT)
+(
+    BLUEPRINT_TOOL_NAMES,
+    BLUEPRINT_MIN_HOURS,
+    BLUEPRINT_MAX_HOURS,
+    BLUEPRINT_CATEGORY_ROWS,
+) = _flatten_blueprint(PLANNING_BLUEPRINT)
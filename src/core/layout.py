@@ -0,0 +1,76 @@
+"""
+App Shell Layout - Header, sidebar and footer markup plus the page routing tables.
+Streamlit re-executes app.py on every rerun, so these live in an imported
+module, where they are built once per process.
+"""
+
+from src.core.config import __version__
+
+HIDE_SIDEBAR_NAV_CSS = """
+    <style>
+        [data-testid="stSidebarNav"] {
+            display: none;
+        }
+    </style>
+"""
+
+HEADER_HTML = """
+<div style="text-align: center; padding: 1rem 0; background: linear-gradient(90deg, #1a1a2e 0%, #16213e 50%, #1a1a2e 100%); border-radius: 10px; margin-bottom: 1rem;">
+    <h1 style="color: #FFD700; margin: 0; font-size: 2.5rem; font-weight: bold; text-shadow: 2px 2px 4px rgba(0,0,0,0.8);">⚡ MG SMART TRACKER</h1>
+    <p style="color: #C0C0C0; margin: 0.5rem 0 0 0; font-size: 1.1rem;">Professional Development Tracking Platform</p>
+</div>
+"""
+
+SIDEBAR_CARD_HTML = """
+<div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); padding: 1rem; border-radius: 10px; border: 1px solid #FFD700; margin-bottom: 1rem;">
+    <h3 style="color: #FFD700; text-align: center; margin: 0;">⚡ MG SYSTEM</h3>
+    <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0; font-size: 0.9rem;">v{}</p>
+</div>
+""".format(__version__)
+
+STATUS_HTML = """
+<div style="background: linear-gradient(135deg, #16213e 0%, #1a1a2e 100%); padding: 1rem; border-radius: 8px; border: 1px solid #C0C0C0;">
+    <h4 style="color: #FFD700; margin-top: 0;">🔧 System Status</h4>
+    <p style="color: #00CED1; margin: 0.5rem 0;"><strong>Status:</strong> <span style="color: #90EE90;">Online</span></p>
+    <p style="color: #00CED1; margin: 0.5rem 0;"><strong>Mode:</strong> Development</p>
+    <p style="color: #00CED1; margin: 0.5rem 0;"><strong>Build:</strong> Professional</p>
+</div>
+"""
+
+FOOTER_HTML = """
+<div style="text-align: center; color: #C0C0C0; font-size: 0.9rem;">
+    <p><strong style="color: #FFD700;">MG System Dev</strong></p>
+    <p>Personal learning & development tracking</p>
+</div>
+"""
+
+# Sidebar navigation: page key -> label, in display order
+NAV_PAGES = {
+    "home_v2": "🏠 Home Dashboard",
+    "clean_dashboard": "📚 Sessions",
+    "learning_tracker": "🎓 Log Session",
+    "tech_stack_crud": "🎯 Tech Stack CRUD",
+    "planning": "📋 Planning",
+    "calculator": "🧮 Calculator",
+    "dropdown_manager": "📝 Dropdown Manager",
+    "analytics": "📊 Analytics",
+}
+
+# Page key -> (module, render function); modules are imported on first visit
+PAGE_ROUTES = {
+    "home_v2": ("src.pages.home_dashboard", "show_home_kpi_dashboard"),
+    "clean_dashboard": ("src.pages.sessions", "show_sessions_page"),
+    "learning_tracker": ("src.pages.log_session", "show_log_session_page"),
+    "tech_stack_crud": ("src.pages.tech_stack", "show_tech_stack_crud_page"),
+    "planning": ("src.pages.planning", "show_planning_page"),
+    "calculator": ("src.pages.calculator", "show_calculator_page"),
+    "dropdown_manager": ("src.pages.dropdown_manager", "show_dropdown_manager_page"),
+    "analytics": ("src.pages.analytics", "show_analytics_page"),
+}
+
+# Page key -> session state keys that only mean something on that page;
+# they are dropped as soon as another page is shown
+PAGE_STATE_KEYS = {
+    "clean_dashboard": ("sessions_export",),
+    "dropdown_manager": ("pending_force_deletes", "tech_editor_errors"),
+}
@@ -0,0 +1,39 @@
+"""
+Logging Setup - Activity log written through a background queue listener.
+Lives outside app.py because Streamlit re-executes the main script on every
+rerun; the lock and handler check here keep setup to once per process.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+_setup_lock = threading.Lock()
+
+
+def start_log_listener():
+    """Route log records through a queue so file writes happen off the rerun thread.
+    
+    Safe to call on every rerun: a QueueHandler already on the root logger
+    means the listener is running, even after Streamlit's caches are cleared.
+    """
+    with _setup_lock:
+        root_logger = logging.getLogger()
+        if any(isinstance(handler, QueueHandler) for handler in root_logger.handlers):
+            return
+        
+        os.makedirs("logs", exist_ok=True)
+        file_handler = logging.FileHandler("logs/activity.log")
+        file_handler.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(message)s"))
+        
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler)
+        listener.start()
+        # Drain queued records to the file before the interpreter exits
+        atexit.register(listener.stop)
+        
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(QueueHandler(log_queue))
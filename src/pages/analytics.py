@@ -4,30 +4,55 @@ Shows detailed metrics for categories, technologies, and work items.
 """
 
 import streamlit as st
-from src.database.operations import DatabaseStorage
-from src.services.cached_queries import CachedQueryService
+from operator import itemgetter
+from src.services.cached_queries import CachedQueryService, get_database
+from src.utils.navigation import back_to_home_button
+
+_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
+    <h1 style="color: #FFD700; margin: 0; text-align: center;">📊 Analytics Dashboard</h1>
+    <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">Advanced Performance Metrics & Data Analysis</p>
+</div>
+"""
+
+_BREAKDOWN_CARD_TEMPLATE = """
+<div style="background: #16213e; padding: 1rem; border-radius: 8px; margin: 0.5rem 0; border-left: 4px solid #FFD700;">
+    <div style="display: flex; justify-content: space-between; align-items: center;">
+        <div>
+            <p style="color: #FFD700; margin: 0; font-weight: bold;">{name}</p>
+            <p style="color: #C0C0C0; margin: 0.3rem 0 0 0; font-size: 0.9rem;">{sessions} sessions</p>
+        </div>
+        <div style="text-align: right;">
+            <p style="color: #FFD700; margin: 0; font-size: 1.2rem; font-weight: bold;">{hours:.1f}h</p>
+            <p style="color: #C0C0C0; margin: 0.3rem 0 0 0; font-size: 0.9rem;">{pct:.1f}%</p>
+        </div>
+    </div>
+</div>"""
+
+
+def _breakdown_cards_html(entries, total_hours):
+    """Render breakdown entries (name/sessions/hours dicts) as one HTML string."""
+    return "".join(
+        _BREAKDOWN_CARD_TEMPLATE.format(
+            name=entry['name'],
+            sessions=entry['sessions'],
+            hours=entry['hours'],
+            pct=(entry['hours'] / total_hours * 100) if total_hours > 0 else 0
+        )
+        for entry in entries
+    )
+
 
 def show_analytics_page():
     """Display the Analytics Dashboard page."""
     
     # Header with MG branding
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
-        <h1 style="color: #FFD700; margin: 0; text-align: center;">📊 Analytics Dashboard</h1>
-        <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">Advanced Performance Metrics & Data Analysis</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Back button
-    if st.button("← Back to Home", help="Return to main page"):
-        st.session_state.current_page = "home_v2"
-        st.rerun()
-    
-    # Initialize database
-    if 'db' not in st.session_state:
-        st.session_state.db = DatabaseStorage()
+    back_to_home_button()
     
-    db = st.session_state.db
+    db = get_database()
     
     st.markdown("---")
     
@@ -39,7 +64,7 @@ def show_analytics_page():
     
     if categories_data:
         # Sort by total hours descending
-        categories_data.sort(key=lambda x: x['total_hours'], reverse=True)
+        categories_data.sort(key=itemgetter('total_hours'), reverse=True)
         
         for cat_data in categories_data:
             with st.expander(f"📂 {cat_data['category']} - {cat_data['total_hours']:.1f}h total", expanded=False):
@@ -55,24 +80,8 @@ def show_analytics_page():
                 st.markdown("---")
                 st.markdown("**🔧 Technology Breakdown:**")
                 
-                # Technology breakdown cards
-                for tech in cat_data['technologies']:
-                    tech_pct = (tech['hours'] / cat_data['total_hours'] * 100) if cat_data['total_hours'] > 0 else 0
-                    
-                    st.markdown(f"""
-                    <div style="background: #16213e; padding: 1rem; border-radius: 8px; margin: 0.5rem 0; border-left: 4px solid #FFD700;">
-                        <div style="display: flex; justify-content: space-between; align-items: center;">
-                            <div>
-                                <p style="color: #FFD700; margin: 0; font-weight: bold;">{tech['name']}</p>
-                                <p style="color: #C0C0C0; margin: 0.3rem 0 0 0; font-size: 0.9rem;">{tech['sessions']} sessions</p>
-                            </div>
-                            <div style="text-align: right;">
-                                <p style="color: #FFD700; margin: 0; font-size: 1.2rem; font-weight: bold;">{tech['hours']:.1f}h</p>
-                                <p style="color: #C0C0C0; margin: 0.3rem 0 0 0; font-size: 0.9rem;">{tech_pct:.1f}%</p>
-                            </div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                # Technology breakdown cards, emitted as one HTML block
+                st.markdown(_breakdown_cards_html(cat_data['technologies'], cat_data['total_hours']), unsafe_allow_html=True)
     else:
         st.info("📚 No category data available. Start logging sessions to see analytics!")
     
@@ -86,7 +95,7 @@ def show_analytics_page():
     
     if technologies_data:
         # Sort by total hours descending
-        technologies_data.sort(key=lambda x: x['total_hours'], reverse=True)
+        technologies_data.sort(key=itemgetter('total_hours'), reverse=True)
         
         for tech_data in technologies_data:
             with st.expander(f"🔧 {tech_data['technology']} ({tech_data['category']}) - {tech_data['total_hours']:.1f}h total", expanded=False):
@@ -105,24 +114,8 @@ def show_analytics_page():
                 st.markdown("---")
                 st.markdown("**📋 Work Item Breakdown:**")
                 
-                # Work item breakdown cards
-                for item in tech_data['work_items']:
-                    item_pct = (item['hours'] / tech_data['total_hours'] * 100) if tech_data['total_hours'] > 0 else 0
-                    
-                    st.markdown(f"""
-                    <div style="background: #16213e; padding: 1rem; border-radius: 8px; margin: 0.5rem 0; border-left: 4px solid #FFD700;">
-                        <div style="display: flex; justify-content: space-between; align-items: center;">
-                            <div>
-                                <p style="color: #FFD700; margin: 0; font-weight: bold;">{item['name']}</p>
-                                <p style="color: #C0C0C0; margin: 0.3rem 0 0 0; font-size: 0.9rem;">{item['sessions']} sessions</p>
-                            </div>
-                            <div style="text-align: right;">
-                                <p style="color: #FFD700; margin: 0; font-size: 1.2rem; font-weight: bold;">{item['hours']:.1f}h</p>
-                                <p style="color: #C0C0C0; margin: 0.3rem 0 0 0; font-size: 0.9rem;">{item_pct:.1f}%</p>
-                            </div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                # Work item breakdown cards, emitted as one HTML block
+                st.markdown(_breakdown_cards_html(tech_data['work_items'], tech_data['total_hours']), unsafe_allow_html=True)
     else:
         st.info("📚 No technology data available. Start logging sessions to see analytics!")
     
@@ -136,7 +129,7 @@ def show_analytics_page():
     
     if work_items_data:
         # Sort by total hours descending
-        work_items_data.sort(key=lambda x: x['total_hours'], reverse=True)
+        work_items_data.sort(key=itemgetter('total_hours'), reverse=True)
         
         for item_data in work_items_data:
             with st.expander(f"📋 {item_data['work_item']} ({item_data['technology']}) - {item_data['total_hours']:.1f}h total", expanded=False):
@@ -160,24 +153,8 @@ def show_analytics_page():
                 st.markdown("---")
                 st.markdown(f"**🎯 Skills Practiced ({item_data['technology']}):**")
                 
-                # Skill breakdown cards
-                for skill in item_data['skills']:
-                    skill_pct = (skill['hours'] / item_data['total_hours'] * 100) if item_data['total_hours'] > 0 else 0
-                    
-                    st.markdown(f"""
-                    <div style="background: #16213e; padding: 1rem; border-radius: 8px; margin: 0.5rem 0; border-left: 4px solid #FFD700;">
-                        <div style="display: flex; justify-content: space-between; align-items: center;">
-                            <div>
-                                <p style="color: #FFD700; margin: 0; font-weight: bold;">{skill['name']}</p>
-                                <p style="color: #C0C0C0; margin: 0.3rem 0 0 0; font-size: 0.9rem;">{skill['sessions']} sessions</p>
-                            </div>
-                            <div style="text-align: right;">
-                                <p style="color: #FFD700; margin: 0; font-size: 1.2rem; font-weight: bold;">{skill['hours']:.1f}h</p>
-                                <p style="color: #C0C0C0; margin: 0.3rem 0 0 0; font-size: 0.9rem;">{skill_pct:.1f}%</p>
-                            </div>
-                        </div>
-                    </div>
-                    """, unsafe_allow_html=True)
+                # Skill breakdown cards, emitted as one HTML block
+                st.markdown(_breakdown_cards_html(item_data['skills'], item_data['total_hours']), unsafe_allow_html=True)
     else:
         st.info("📚 No work item data available. Start logging sessions with work items to see analytics!")
     
@@ -4,36 +4,42 @@ Calculates completion time based on total hours and work schedule.
 """
 
 import streamlit as st
-from src.database.operations import DatabaseStorage
+from src.services.cached_queries import CachedQueryService, get_database
+from src.utils.navigation import back_to_home_button
+
+TIME_UNIT_OPTIONS = ("Week", "Day", "Month")
+
+_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
+    <h1 style="color: #FFD700; margin: 0; text-align: center;">🧮 Workload Calculator</h1>
+    <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">Time Estimation & Completion Metrics</p>
+</div>
+"""
+
+_KPI_CARD_TEMPLATE = """
+<div style="background: linear-gradient(135deg, #16213e 0%, #0f3460 100%); padding: 1.5rem; border-radius: 12px; border: 2px solid #FFD700; text-align: center;">
+    <h3 style="color: #FFD700; margin: 0;">{title}</h3>
+    <p style="color: #FFFFFF; font-size: 2rem; font-weight: bold; margin: 1rem 0 0 0;">{value:.1f}</p>
+</div>
+"""
 
 def show_calculator_page():
     """Display the Calculator page for workload estimation."""
     
     # Header with MG branding
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
-        <h1 style="color: #FFD700; margin: 0; text-align: center;">🧮 Workload Calculator</h1>
-        <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">Time Estimation & Completion Metrics</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Back button
-    if st.button("← Back to Home", help="Return to main page"):
-        st.session_state.current_page = "home_v2"
-        st.rerun()
-    
-    # Initialize database
-    if 'db' not in st.session_state:
-        st.session_state.db = DatabaseStorage()
+    back_to_home_button()
     
-    db = st.session_state.db
+    db = get_database()
     
     st.markdown("---")
     
     # Get total hours from tech stack and planning
-    tech_stack = db.get_all_tech_stack()
+    tech_stack = CachedQueryService.get_all_tech_stack(db)
     total_goal_hours = sum(tech.get('goal_hours', 0) for tech in tech_stack)
-    total_logged_hours = db.get_total_hours()
+    total_logged_hours = CachedQueryService.get_dashboard_metrics(db)['total_hours']
     remaining_hours = max(0, total_goal_hours - total_logged_hours)
     
     # Display current workload summary
@@ -64,7 +70,7 @@ def show_calculator_page():
                                      help="Enter how many hours you plan to work")
     
     with col_unit:
-        time_unit = st.selectbox("Per", options=["Week", "Day", "Month"], 
+        time_unit = st.selectbox("Per", options=TIME_UNIT_OPTIONS, 
                                 help="Select time unit")
     
     # Convert input to hours per week for calculations
@@ -92,36 +98,16 @@ def show_calculator_page():
         kpi_col1, kpi_col2, kpi_col3, kpi_col4 = st.columns(4)
         
         with kpi_col1:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #16213e 0%, #0f3460 100%); padding: 1.5rem; border-radius: 12px; border: 2px solid #FFD700; text-align: center;">
-                <h3 style="color: #FFD700; margin: 0;">⏰ Hours</h3>
-                <p style="color: #FFFFFF; font-size: 2rem; font-weight: bold; margin: 1rem 0 0 0;">{:.1f}</p>
-            </div>
-            """.format(remaining_hours), unsafe_allow_html=True)
+            st.markdown(_KPI_CARD_TEMPLATE.format(title="⏰ Hours", value=remaining_hours), unsafe_allow_html=True)
         
         with kpi_col2:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #16213e 0%, #0f3460 100%); padding: 1.5rem; border-radius: 12px; border: 2px solid #FFD700; text-align: center;">
-                <h3 style="color: #FFD700; margin: 0;">📆 Days</h3>
-                <p style="color: #FFFFFF; font-size: 2rem; font-weight: bold; margin: 1rem 0 0 0;">{:.1f}</p>
-            </div>
-            """.format(days_to_complete), unsafe_allow_html=True)
+            st.markdown(_KPI_CARD_TEMPLATE.format(title="📆 Days", value=days_to_complete), unsafe_allow_html=True)
         
         with kpi_col3:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #16213e 0%, #0f3460 100%); padding: 1.5rem; border-radius: 12px; border: 2px solid #FFD700; text-align: center;">
-                <h3 style="color: #FFD700; margin: 0;">📅 Weeks</h3>
-                <p style="color: #FFFFFF; font-size: 2rem; font-weight: bold; margin: 1rem 0 0 0;">{:.1f}</p>
-            </div>
-            """.format(weeks_to_complete), unsafe_allow_html=True)
+            st.markdown(_KPI_CARD_TEMPLATE.format(title="📅 Weeks", value=weeks_to_complete), unsafe_allow_html=True)
         
         with kpi_col4:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #16213e 0%, #0f3460 100%); padding: 1.5rem; border-radius: 12px; border: 2px solid #FFD700; text-align: center;">
-                <h3 style="color: #FFD700; margin: 0;">🗓️ Months</h3>
-                <p style="color: #FFFFFF; font-size: 2rem; font-weight: bold; margin: 1rem 0 0 0;">{:.1f}</p>
-            </div>
-            """.format(months_to_complete), unsafe_allow_html=True)
+            st.markdown(_KPI_CARD_TEMPLATE.format(title="🗓️ Months", value=months_to_complete), unsafe_allow_html=True)
         
         st.markdown("---")
         
@@ -131,19 +117,24 @@ def show_calculator_page():
         col_detail1, col_detail2 = st.columns(2)
         
         with col_detail1:
-            st.markdown("#### Work Schedule")
-            st.write(f"• **Hours per day:** {hours_per_day:.1f}")
-            st.write(f"• **Hours per week:** {hours_per_week:.1f}")
-            st.write(f"• **Hours per month:** {hours_per_week * 4.33:.1f}")
+            # Heading and lines go out as one markdown element per column
+            st.markdown("  \n".join((
+                "#### Work Schedule",
+                f"• **Hours per day:** {hours_per_day:.1f}",
+                f"• **Hours per week:** {hours_per_week:.1f}",
+                f"• **Hours per month:** {hours_per_week * 4.33:.1f}"
+            )))
         
         with col_detail2:
-            st.markdown("#### Completion Estimates")
             # Calculate calendar dates if possible
             from datetime import datetime, timedelta
             completion_date = datetime.now() + timedelta(days=days_to_complete)
-            st.write(f"• **Estimated completion:** {completion_date.strftime('%B %d, %Y')}")
-            st.write(f"• **Working days:** {days_to_complete:.0f} days")
-            st.write(f"• **Calendar days:** {days_to_complete * 1.4:.0f} days (including weekends)")
+            st.markdown("  \n".join((
+                "#### Completion Estimates",
+                f"• **Estimated completion:** {completion_date.strftime('%B %d, %Y')}",
+                f"• **Working days:** {days_to_complete:.0f} days",
+                f"• **Calendar days:** {days_to_complete * 1.4:.0f} days (including weekends)"
+            )))
         
         # Progress visualization
         st.markdown("---")
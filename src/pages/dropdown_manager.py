@@ -5,42 +5,43 @@ Uses sync services to ensure data consistency across all tables.
 """
 
 import streamlit as st
+from operator import itemgetter
+import pandas as pd
+from collections import Counter
 from src.utils.dropdowns import DropdownManager
-from src.database.operations import DatabaseStorage
 from src.services.sync_service import TechnologySyncService, CategorySyncService
-from src.services.cached_queries import CachedQueryService
+from src.services.cached_queries import CachedQueryService, get_database
+from src.utils.navigation import back_to_home_button, set_state
 from datetime import datetime
 import logging
 
+_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
+    <h1 style="color: #FFD700; margin: 0; text-align: center;">📝 Dropdown Manager</h1>
+    <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">Centralized Data Management Hub</p>
+</div>
+"""
+
 def show_dropdown_manager_page():
     """Display the Dropdown Manager page."""
     
     # Header with MG branding
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
-        <h1 style="color: #FFD700; margin: 0; text-align: center;">📝 Dropdown Manager</h1>
-        <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">Centralized Data Management Hub</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Back button
-    if st.button("← Back to Home", help="Return to main page"):
-        st.session_state.current_page = "home_v2"
-        st.rerun()
-    
-    # Initialize database and services
-    if 'db' not in st.session_state:
-        st.session_state.db = DatabaseStorage()
+    back_to_home_button()
     
-    db = st.session_state.db
+    db = get_database()
     dropdown_manager = DropdownManager(db)
     tech_service = TechnologySyncService(db)
     category_service = CategorySyncService(db)
     
     st.markdown("---")
     
-    # Get all dropdown data
+    # Get all dropdown data, plus the category and tech lists shared by every tab
     all_dropdowns = dropdown_manager.get_all_dropdown_data()
+    all_categories = db.get_all_categories()
+    custom_categories = db.get_custom_categories()
     
     # Create tabs for different management sections
     tabs = st.tabs([
@@ -78,8 +79,9 @@ def show_dropdown_manager_page():
         # Manage existing categories
         st.markdown("#### 📋 Existing Categories")
         
-        custom_categories = db.get_custom_categories()
-        all_categories = db.get_all_categories()
+        tech_stack = CachedQueryService.get_all_tech_stack(db)
+        # Technologies per category, counted in one pass over the stack
+        tech_counts = Counter(tech.get('category') for tech in tech_stack)
         
         if not custom_categories:
             st.info("No custom categories yet. Add one above to get started!")
@@ -88,26 +90,19 @@ def show_dropdown_manager_page():
             
             for cat in custom_categories:
                 # Count technologies in this category
-                tech_stack = db.get_all_tech_stack()
-                tech_count = sum(1 for tech in tech_stack if tech.get('category') == cat)
+                tech_count = tech_counts[cat]
                 
                 with st.expander(f"**{cat}** ({tech_count} technologies)", expanded=False):
                     col1, col2, col3 = st.columns(3)
                     
                     with col1:
-                        if st.button("✏️ Rename", key=f"rename_cat_{cat}", use_container_width=True):
-                            st.session_state.renaming_category = cat
-                            st.rerun()
+                        st.button("✏️ Rename", key=f"rename_cat_{cat}", use_container_width=True, on_click=set_state, args=('renaming_category', cat))
                     
                     with col2:
-                        if st.button("🗑️ Delete", key=f"delete_cat_{cat}", use_container_width=True):
-                            st.session_state.deleting_category = cat
-                            st.rerun()
+                        st.button("🗑️ Delete", key=f"delete_cat_{cat}", use_container_width=True, on_click=set_state, args=('deleting_category', cat))
                     
                     with col3:
-                        if st.button("🔀 Merge", key=f"merge_cat_{cat}", use_container_width=True):
-                            st.session_state.merging_category = cat
-                            st.rerun()
+                        st.button("🔀 Merge", key=f"merge_cat_{cat}", use_container_width=True, on_click=set_state, args=('merging_category', cat))
                     
                     # Rename form
                     if st.session_state.get('renaming_category') == cat:
@@ -130,9 +125,7 @@ def show_dropdown_manager_page():
                                         st.error("Please enter a valid name")
                             
                             with col_cancel:
-                                if st.form_submit_button("❌ Cancel", use_container_width=True):
-                                    st.session_state.renaming_category = None
-                                    st.rerun()
+                                st.form_submit_button("❌ Cancel", use_container_width=True, on_click=set_state, args=('renaming_category', None))
                     
                     # Delete confirmation
                     if st.session_state.get('deleting_category') == cat:
@@ -153,9 +146,7 @@ def show_dropdown_manager_page():
                                     st.error(f"❌ {result['message']}")
                         
                         with col_cancel:
-                            if st.button("❌ Cancel", key=f"cancel_del_cat_{cat}", use_container_width=True):
-                                st.session_state.deleting_category = None
-                                st.rerun()
+                            st.button("❌ Cancel", key=f"cancel_del_cat_{cat}", use_container_width=True, on_click=set_state, args=('deleting_category', None))
                     
                     # Merge form
                     if st.session_state.get('merging_category') == cat:
@@ -176,9 +167,7 @@ def show_dropdown_manager_page():
                                         st.error("Failed to merge categories")
                             
                             with col_cancel:
-                                if st.form_submit_button("❌ Cancel", use_container_width=True):
-                                    st.session_state.merging_category = None
-                                    st.rerun()
+                                st.form_submit_button("❌ Cancel", use_container_width=True, on_click=set_state, args=('merging_category', None))
     
     # ==================== TAB 2: MANAGE TECHNOLOGIES ====================
     with tabs[1]:
@@ -196,8 +185,7 @@ def show_dropdown_manager_page():
                 goal_hours = st.number_input("Goal Hours *", min_value=1.0, value=50.0, step=5.0)
             
             with col2:
-                categories = db.get_all_categories()
-                category = st.selectbox("Category *", options=categories)
+                category = st.selectbox("Category *", options=all_categories)
                 date_added = st.date_input("Date Added", value=datetime.now())
             
             submitted = st.form_submit_button("💾 Add Technology", type="primary")
@@ -225,125 +213,115 @@ def show_dropdown_manager_page():
         # Manage existing technologies
         st.markdown("#### 📋 Current Technologies")
         
-        tech_stack = db.get_all_tech_stack()
+        tech_stack = CachedQueryService.get_all_tech_stack(db)
         
         if not tech_stack:
             st.info("📚 No technologies in your stack yet. Add your first one!")
         else:
             st.caption(f"Total: {len(tech_stack)} technologies")
             
-            # Group by category
-            by_category = {}
-            for tech in tech_stack:
-                cat = tech.get('category', 'Uncategorized')
-                if cat not in by_category:
-                    by_category[cat] = []
-                by_category[cat].append(tech)
+            tech_by_id = {tech['id']: tech for tech in tech_stack}
             
-            # Display by category
-            for category, techs in sorted(by_category.items()):
-                with st.expander(f"**{category}** ({len(techs)} technologies)", expanded=False):
-                    for tech in sorted(techs, key=lambda x: x['name']):
-                        tech_id = tech['id']
-                        tech_name = tech['name']
-                        goal_hours = tech.get('goal_hours', 50)
-                        date_added = tech.get('date_added', 'Unknown')
-                        
-                        st.markdown(f"**{tech_name}** • Goal: {goal_hours}h • Added: {date_added}")
-                        
-                        col_edit, col_del = st.columns(2)
-                        
-                        with col_edit:
-                            if st.button(f"✏️ Edit", key=f"edit_{tech_id}", use_container_width=True):
-                                st.session_state.editing_tech = tech_id
-                                st.rerun()
-                        
-                        with col_del:
-                            if st.button(f"🗑️ Delete", key=f"del_{tech_id}", use_container_width=True):
-                                st.session_state.deleting_tech = tech_id
-                                st.rerun()
-                        
-                        # Edit form
-                        if st.session_state.get('editing_tech') == tech_id:
-                            with st.form(f"edit_form_{tech_id}"):
-                                st.markdown("##### Edit Technology")
-                                
-                                edit_name = st.text_input("Name", value=tech_name, key=f"edit_name_{tech_id}")
-                                edit_category = st.selectbox("Category", options=db.get_all_categories(), 
-                                                            index=db.get_all_categories().index(tech.get('category', 'Uncategorized')) if tech.get('category') in db.get_all_categories() else 0,
-                                                            key=f"edit_cat_{tech_id}")
-                                edit_goal = st.number_input("Goal Hours", value=float(goal_hours), min_value=1.0, step=5.0, key=f"edit_goal_{tech_id}")
-                                
-                                col_save, col_cancel = st.columns(2)
-                                with col_save:
-                                    if st.form_submit_button("💾 Save Changes", use_container_width=True):
-                                        result = tech_service.update_technology(
-                                            tech_id, 
-                                            name=edit_name, 
-                                            category=edit_category, 
-                                            goal_hours=edit_goal
-                                        )
-                                        
-                                        if result['success']:
-                                            st.success(f"✅ {result['message']}")
-                                            logging.info(f"Updated technology ID {tech_id}: {edit_name}")
-                                            CachedQueryService.invalidate_cache()
-                                            st.session_state.editing_tech = None
-                                            st.rerun()
-                                        else:
-                                            st.error(f"❌ {result['message']}")
-                                
-                                with col_cancel:
-                                    if st.form_submit_button("❌ Cancel", use_container_width=True):
-                                        st.session_state.editing_tech = None
-                                        st.rerun()
-                        
-                        # Delete confirmation
-                        if st.session_state.get('deleting_tech') == tech_id:
-                            result = tech_service.delete_technology(tech_id)
-                            
-                            if result.get('requires_confirmation'):
-                                st.warning(f"⚠️ {result['message']}")
-                                st.info("💡 Choose: Delete anyway (marks sessions as [Deleted]) or Cancel")
-                                
-                                col_force, col_cancel_del = st.columns(2)
-                                
-                                with col_force:
-                                    if st.button("🗑️ Delete Anyway", key=f"force_del_{tech_id}", use_container_width=True, type="primary"):
-                                        force_result = tech_service.force_delete_technology(tech_id)
-                                        if force_result['success']:
-                                            st.success(f"✅ {force_result['message']}")
-                                            CachedQueryService.invalidate_cache()
-                                            st.session_state.deleting_tech = None
-                                            st.rerun()
-                                        else:
-                                            st.error(f"❌ {force_result['message']}")
-                                
-                                with col_cancel_del:
-                                    if st.button("❌ Cancel", key=f"cancel_force_{tech_id}", use_container_width=True):
-                                        st.session_state.deleting_tech = None
-                                        st.rerun()
-                            else:
-                                st.warning(f"⚠️ Delete {tech_name}?")
-                                col_confirm, col_cancel_del = st.columns(2)
-                                
-                                with col_confirm:
-                                    if st.button("✅ Yes, Delete", key=f"confirm_del_{tech_id}", use_container_width=True, type="primary"):
-                                        if result['success']:
-                                            st.success(f"🗑️ {result['message']}")
-                                            logging.info(f"Deleted technology ID {tech_id}: {tech_name}")
-                                            CachedQueryService.invalidate_cache()
-                                            st.session_state.deleting_tech = None
-                                            st.rerun()
-                                        else:
-                                            st.error(f"❌ {result['message']}")
-                            
-                                with col_cancel_del:
-                                    if st.button("❌ Cancel", key=f"cancel_del_{tech_id}", use_container_width=True):
-                                        st.session_state.deleting_tech = None
-                                        st.rerun()
-                        
-                        st.markdown("---")
+            # Edit every technology in one grid; nothing reruns until the form is saved
+            with st.form("tech_editor_form"):
+                edited_df = st.data_editor(
+                    pd.DataFrame([
+                        {
+                            'id': tech['id'],
+                            'name': tech['name'],
+                            'category': tech.get('category', 'Uncategorized'),
+                            'goal_hours': float(tech.get('goal_hours', 50)),
+                            'date_added': tech.get('date_added', 'Unknown'),
+                            'delete': False
+                        }
+                        for tech in sorted(tech_stack, key=lambda x: (x.get('category', ''), x['name']))
+                    ]),
+                    column_config={
+                        'id': None,
+                        'name': st.column_config.TextColumn("Name", required=True),
+                        'category': st.column_config.SelectboxColumn("Category", options=all_categories, required=True),
+                        'goal_hours': st.column_config.NumberColumn("Goal Hours", min_value=1.0, step=5.0, required=True),
+                        'date_added': st.column_config.TextColumn("Added", disabled=True),
+                        'delete': st.column_config.CheckboxColumn("🗑️ Delete")
+                    },
+                    hide_index=True,
+                    use_container_width=True,
+                    key="tech_editor"
+                )
+                saved_techs = st.form_submit_button("💾 Save Changes", type="primary")
+            
+            if saved_techs:
+                changed = False
+                needs_confirmation = []
+                errors = []
+                
+                for row in edited_df.to_dict('records'):
+                    tech_id = int(row['id'])
+                    tech = tech_by_id[tech_id]
+                    
+                    if row['delete']:
+                        result = tech_service.delete_technology(tech_id)
+                        if result.get('requires_confirmation'):
+                            needs_confirmation.append((tech_id, result['message']))
+                        elif result['success']:
+                            logging.info(f"Deleted technology ID {tech_id}: {tech['name']}")
+                            changed = True
+                        else:
+                            errors.append(result['message'])
+                        continue
+                    
+                    edit_name = str(row['name']).strip()
+                    if (edit_name, row['category'], float(row['goal_hours'])) == (
+                        tech['name'], tech.get('category', 'Uncategorized'), float(tech.get('goal_hours', 50))
+                    ):
+                        continue
+                    
+                    result = tech_service.update_technology(
+                        tech_id, 
+                        name=edit_name, 
+                        category=row['category'], 
+                        goal_hours=float(row['goal_hours'])
+                    )
+                    
+                    if result['success']:
+                        logging.info(f"Updated technology ID {tech_id}: {edit_name}")
+                        changed = True
+                    else:
+                        errors.append(result['message'])
+                
+                # Errors go through session state so they survive the rerun below
+                st.session_state.pending_force_deletes = needs_confirmation
+                st.session_state.tech_editor_errors = errors
+                if changed:
+                    CachedQueryService.invalidate_cache()
+                    st.rerun()
+            
+            for message in st.session_state.pop('tech_editor_errors', []):
+                st.error(f"❌ {message}")
+            
+            # Technologies still used by sessions need an explicit force delete
+            pending_force_deletes = st.session_state.get('pending_force_deletes', [])
+            if pending_force_deletes:
+                for _, message in pending_force_deletes:
+                    st.warning(f"⚠️ {message}")
+                st.info("💡 Choose: Delete anyway (marks sessions as [Deleted]) or Cancel")
+                
+                col_force, col_cancel_del = st.columns(2)
+                
+                with col_force:
+                    if st.button("🗑️ Delete Anyway", key="force_del_techs", use_container_width=True, type="primary"):
+                        errors = []
+                        for tech_id, _ in pending_force_deletes:
+                            force_result = tech_service.force_delete_technology(tech_id)
+                            if not force_result['success']:
+                                errors.append(force_result['message'])
+                        st.session_state.tech_editor_errors = errors
+                        CachedQueryService.invalidate_cache()
+                        st.session_state.pending_force_deletes = []
+                        st.rerun()
+                
+                with col_cancel_del:
+                    st.button("❌ Cancel", key="cancel_force_techs", use_container_width=True, on_click=set_state, args=('pending_force_deletes', []))
     
     # ==================== TAB 3: MANAGE DROPDOWNS ====================
     with tabs[2]:
@@ -361,7 +339,7 @@ def show_dropdown_manager_page():
             
             with col1:
                 # Select parent technology
-                all_techs = [tech['name'] for tech in db.get_all_tech_stack()]
+                all_techs = [tech['name'] for tech in CachedQueryService.get_all_tech_stack(db)]
                 if all_techs:
                     parent_tech = st.selectbox("Technology", options=all_techs)
                 else:
@@ -396,9 +374,9 @@ def show_dropdown_manager_page():
         else:
             st.caption(f"Total: {len(all_work_items)} manually defined work items")
             
-            # Group by technology
+            # Group by technology; sorting by name first leaves each group ordered
             by_tech = {}
-            for item in all_work_items:
+            for item in sorted(all_work_items, key=itemgetter('name')):
                 tech = item['technology']
                 if tech not in by_tech:
                     by_tech[tech] = []
@@ -406,7 +384,7 @@ def show_dropdown_manager_page():
             
             for tech, items in sorted(by_tech.items()):
                 with st.expander(f"**{tech}** ({len(items)} work items)", expanded=False):
-                    for item in sorted(items, key=lambda x: x['name']):
+                    for item in items:
                         col1, col2 = st.columns([4, 1])
                         with col1:
                             st.markdown(f"**{item['name']}**")
@@ -471,9 +449,9 @@ def show_dropdown_manager_page():
         else:
             st.caption(f"Total: {len(all_skills)} manually defined skills")
             
-            # Group by work item
+            # Group by work item; sorting by name first leaves each group ordered
             by_work_item = {}
-            for skill in all_skills:
+            for skill in sorted(all_skills, key=itemgetter('name')):
                 work_item = skill['work_item']
                 if work_item not in by_work_item:
                     by_work_item[work_item] = []
@@ -481,7 +459,7 @@ def show_dropdown_manager_page():
             
             for work_item, skills in sorted(by_work_item.items()):
                 with st.expander(f"**{work_item}** ({len(skills)} skills)", expanded=False):
-                    for skill in sorted(skills, key=lambda x: x['name']):
+                    for skill in skills:
                         col1, col2 = st.columns([4, 1])
                         with col1:
                             st.markdown(f"**{skill['name']}**")
@@ -502,12 +480,11 @@ def show_dropdown_manager_page():
         
         with col1:
             st.markdown("#### Categories & Technologies")
-            all_categories = db.get_all_categories()
-            tech_stack = db.get_all_tech_stack()
+            tech_stack = CachedQueryService.get_all_tech_stack(db)
             
             st.metric("Total Categories", len(all_categories))
             st.metric("Total Technologies", len(tech_stack))
-            st.metric("Custom Categories", len(db.get_custom_categories()))
+            st.metric("Custom Categories", len(custom_categories))
         
         with col2:
             st.markdown("#### Dropdown Values")
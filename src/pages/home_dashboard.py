@@ -4,28 +4,40 @@ No editing functionality - pure KPI and metrics display.
 """
 
 import streamlit as st
-from src.database.operations import DatabaseStorage
-from src.services import CachedQueryService
-from datetime import datetime, timedelta
-import pandas as pd
+from operator import itemgetter
+from src.services import CachedQueryService, get_database
+from src.utils.navigation import go_to
+from datetime import datetime
+
+_HEADER_HTML = """
+<div class="main-header" style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 2rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700; box-shadow: 0 8px 32px rgba(255, 215, 0, 0.3);">
+    <h1 style="color: #FFD700; text-align: center; margin: 0; font-size: 3rem; text-shadow: 2px 2px 4px rgba(0,0,0,0.8);">⚡ MG SMART TRACKER</h1>
+    <p style="color: #C0C0C0; text-align: center; margin-top: 0.5rem; font-size: 1.2rem;">Professional Development Tracking Platform</p>
+    <p style="color: #FFD700; text-align: center; margin-top: 0.3rem; font-size: 0.9rem;">SYSTEM DEV | Real-Time Operations Dashboard</p>
+</div>
+"""
+
+_STATUS_CARD_TEMPLATE = """
+<div style="background: #0f3460; padding: 1rem; border-radius: 8px; border: 1px solid #FFD700;">
+    <p style="color: #FFD700; margin: 0; font-weight: bold;">{title}</p>
+    <p style="color: {color}; margin: 0.5rem 0 0 0;">{value}</p>
+</div>
+"""
+
+_ACTIVITY_CARD_TEMPLATE = """
+<div style="background: linear-gradient(135deg, #16213e 0%, #1a1a2e 100%); padding: 1rem; border-radius: 10px; border-left: 4px solid #FFD700; margin-bottom: 0.5rem;">
+    <p style="color: #FFD700; margin: 0; font-weight: bold;">{icon} {tech} • {skill}</p>
+    <p style="color: #C0C0C0; margin: 0.3rem 0 0 0; font-size: 0.9rem;">{date} • {hours:.1f} hours • {session_type}</p>
+</div>
+"""
 
 def show_home_kpi_dashboard():
     """Display the Home page as KPI dashboard only."""
     
     # Header with MG branding
-    st.markdown("""
-    <div class="main-header" style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 2rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700; box-shadow: 0 8px 32px rgba(255, 215, 0, 0.3);">
-        <h1 style="color: #FFD700; text-align: center; margin: 0; font-size: 3rem; text-shadow: 2px 2px 4px rgba(0,0,0,0.8);">⚡ MG SMART TRACKER</h1>
-        <p style="color: #C0C0C0; text-align: center; margin-top: 0.5rem; font-size: 1.2rem;">Professional Development Tracking Platform</p>
-        <p style="color: #FFD700; text-align: center; margin-top: 0.3rem; font-size: 0.9rem;">SYSTEM DEV | Real-Time Operations Dashboard</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
-    # Initialize database
-    if 'db' not in st.session_state:
-        st.session_state.db = DatabaseStorage()
-    
-    db = st.session_state.db
+    db = get_database()
     
     # ==================== KEY METRICS SECTION ====================
     st.markdown("### 📊 Key Performance Indicators")
@@ -37,7 +49,15 @@ def show_home_kpi_dashboard():
     total_sessions = metrics['total_sessions']
     total_hours = metrics['total_hours']
     total_technologies = metrics['tech_count']
-    total_goal_hours = sum(tech.get('goal_hours', 0) for tech in tech_stack)
+    
+    # Goal hours overall and per category, summed in one pass over the stack
+    total_goal_hours = 0
+    goal_by_category = {}
+    for tech in tech_stack:
+        goal_hours = tech.get('goal_hours', 0)
+        total_goal_hours += goal_hours
+        category = tech.get('category')
+        goal_by_category[category] = goal_by_category.get(category, 0) + goal_hours
     
     # Display KPI cards
     kpi_col1, kpi_col2, kpi_col3, kpi_col4 = st.columns(4)
@@ -60,7 +80,7 @@ def show_home_kpi_dashboard():
     # ==================== STUDYING VS PRACTICE BREAKDOWN ====================
     st.markdown("### 📊 Session Type Breakdown")
     
-    type_breakdown = db.get_session_type_breakdown()
+    type_breakdown = CachedQueryService.get_session_type_breakdown(db)
     
     if type_breakdown:
         breakdown_col1, breakdown_col2, breakdown_col3 = st.columns(3)
@@ -90,23 +110,21 @@ def show_home_kpi_dashboard():
     recent_sessions = CachedQueryService.get_sessions_with_details(db, limit=5, offset=0)
     
     if recent_sessions:
-        
-        for session in recent_sessions:
-            activity_date = session.get('session_date', 'Unknown')
-            tech = session.get('technology', 'Unknown')
-            skill = session.get('skill_topic', 'N/A')
-            hours = session.get('hours_spent', 0)
-            session_type = session.get('session_type', 'Unknown')
-            
-            # Activity card
-            type_icon = "📚" if session_type == "Studying" else "💪"
-            
-            st.markdown(f"""
-            <div style="background: linear-gradient(135deg, #16213e 0%, #1a1a2e 100%); padding: 1rem; border-radius: 10px; border-left: 4px solid #FFD700; margin-bottom: 0.5rem;">
-                <p style="color: #FFD700; margin: 0; font-weight: bold;">{type_icon} {tech} • {skill}</p>
-                <p style="color: #C0C0C0; margin: 0.3rem 0 0 0; font-size: 0.9rem;">{activity_date} • {hours:.1f} hours • {session_type}</p>
-            </div>
-            """, unsafe_allow_html=True)
+        # The query is capped at 5 rows; emit the whole feed as one element.
+        # Rows carry every sessions column, so index directly; only
+        # skill_topic is nullable.
+        activity_cards = "".join(
+            _ACTIVITY_CARD_TEMPLATE.format(
+                icon="📚" if session['session_type'] == "Studying" else "💪",
+                tech=session['technology'],
+                skill=session['skill_topic'] or 'N/A',
+                date=session['session_date'],
+                hours=session['hours_spent'],
+                session_type=session['session_type']
+            )
+            for session in recent_sessions
+        )
+        st.markdown(activity_cards, unsafe_allow_html=True)
     else:
         st.info("No recent activity. Start logging sessions to see updates here!")
     
@@ -120,9 +138,9 @@ def show_home_kpi_dashboard():
     
     if category_stats:
         # Display as collapsible sections (default closed)
-        for category, hours in sorted(category_stats.items(), key=lambda x: x[1], reverse=True):
-            # Get goal hours for this category from tech stack
-            cat_goal = sum(tech.get('goal_hours', 0) for tech in tech_stack if tech.get('category') == category)
+        for category, hours in sorted(category_stats.items(), key=itemgetter(1), reverse=True):
+            # Get goal hours for this category from the precomputed map
+            cat_goal = goal_by_category.get(category, 0)
             cat_progress = (hours / cat_goal * 100) if cat_goal > 0 else 0
             
             with st.expander(f"**{category}** - {hours:.1f}h logged ({cat_progress:.1f}% complete)", expanded=False):
@@ -151,52 +169,28 @@ def show_home_kpi_dashboard():
     nav_col1, nav_col2, nav_col3, nav_col4 = st.columns(4)
     
     with nav_col1:
-        if st.button("🎓 Log Session", use_container_width=True, type="primary"):
-            st.session_state.current_page = "learning_tracker"
-            st.rerun()
+        st.button("🎓 Log Session", use_container_width=True, type="primary", on_click=go_to, args=("learning_tracker",))
     
     with nav_col2:
-        if st.button("🎯 Tech Stack", use_container_width=True):
-            st.session_state.current_page = "tech_stack_crud"
-            st.rerun()
+        st.button("🎯 Tech Stack", use_container_width=True, on_click=go_to, args=("tech_stack_crud",))
     
     with nav_col3:
-        if st.button("📋 Planning", use_container_width=True):
-            st.session_state.current_page = "planning"
-            st.rerun()
+        st.button("📋 Planning", use_container_width=True, on_click=go_to, args=("planning",))
     
     with nav_col4:
-        if st.button("🧮 Calculator", use_container_width=True):
-            st.session_state.current_page = "calculator"
-            st.rerun()
+        st.button("🧮 Calculator", use_container_width=True, on_click=go_to, args=("calculator",))
     
     st.markdown("---")
     
     # ==================== SYSTEM STATUS ====================
     st.markdown("### 🔧 System Status")
     
-    status_col1, status_col2, status_col3 = st.columns(3)
-    
-    with status_col1:
-        st.markdown("""
-        <div style="background: #0f3460; padding: 1rem; border-radius: 8px; border: 1px solid #FFD700;">
-            <p style="color: #FFD700; margin: 0; font-weight: bold;">Database</p>
-            <p style="color: #00FF00; margin: 0.5rem 0 0 0;">✅ Connected</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with status_col2:
-        st.markdown("""
-        <div style="background: #0f3460; padding: 1rem; border-radius: 8px; border: 1px solid #FFD700;">
-            <p style="color: #FFD700; margin: 0; font-weight: bold;">Last Updated</p>
-            <p style="color: #C0C0C0; margin: 0.5rem 0 0 0;">{}</p>
-        </div>
-        """.format(datetime.now().strftime('%Y-%m-%d %H:%M')), unsafe_allow_html=True)
-    
-    with status_col3:
-        st.markdown("""
-        <div style="background: #0f3460; padding: 1rem; border-radius: 8px; border: 1px solid #FFD700;">
-            <p style="color: #FFD700; margin: 0; font-weight: bold;">Mode</p>
-            <p style="color: #C0C0C0; margin: 0.5rem 0 0 0;">Development</p>
-        </div>
-        """, unsafe_allow_html=True)
+    status_cards = (
+        ("Database", "#00FF00", "✅ Connected"),
+        ("Last Updated", "#C0C0C0", datetime.now().strftime('%Y-%m-%d %H:%M')),
+        ("Mode", "#C0C0C0", "Development"),
+    )
+    
+    for status_col, (title, color, value) in zip(st.columns(3), status_cards):
+        with status_col:
+            st.markdown(_STATUS_CARD_TEMPLATE.format(title=title, color=color, value=value), unsafe_allow_html=True)
@@ -5,31 +5,27 @@ Uses the new hierarchical dropdown system for data entry.
 
 import streamlit as st
 from datetime import date, datetime
-from src.database.operations import DatabaseStorage
 from src.utils.dropdowns import DropdownManager
-from src.services import CachedQueryService
+from src.services import CachedQueryService, get_database
+from src.utils.navigation import back_to_home_button
 import logging
 
+_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
+    <h1 style="color: #FFD700; margin: 0; text-align: center;">🎓 Log New Session</h1>
+    <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">Track Your Learning Progress</p>
+</div>
+"""
+
 def show_log_session_page():
     """Display the Log Session page for creating new sessions."""
     # Header with MG branding
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
-        <h1 style="color: #FFD700; margin: 0; text-align: center;">🎓 Log New Session</h1>
-        <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">Track Your Learning Progress</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Back button
-    if st.button("← Back to Home"):
-        st.session_state.current_page = "home_v2"
-        st.rerun()
-    
-    # Initialize database
-    if 'db' not in st.session_state:
-        st.session_state.db = DatabaseStorage()
+    back_to_home_button(help=None)
     
-    db = st.session_state.db
+    db = get_database()
     dropdown_manager = DropdownManager(db)
     
     st.markdown("---")
@@ -110,8 +106,8 @@ def show_log_session_page():
                     # CRITICAL: Invalidate cache so dashboard refreshes immediately
                     CachedQueryService.invalidate_cache()
                     
-                    st.success(f"✅ Session saved successfully! (ID: {session_id})")
-                    st.balloons()
+                    saved_label = selected_values.get('skill_topic') or selected_values.get('work_item') or selected_values.get('technology')
+                    st.toast(f"Saved: {saved_label} (ID: {session_id})", icon="✅")
                     logging.info(f"Added session ID {session_id}: {selected_values.get('technology')} - {hours_spent}h")
                 else:
                     st.error("❌ Failed to save session")
@@ -120,16 +116,15 @@ def show_log_session_page():
     st.markdown("---")
     st.markdown("### 📈 Quick Stats")
     
-    all_sessions = db.get_all_sessions()
-    total_sessions = len(all_sessions)
-    total_hours = db.get_total_hours()
+    # Cached aggregate query (cleared on save) instead of fetching every session
+    metrics = CachedQueryService.get_dashboard_metrics(db)
     
     col_stat1, col_stat2, col_stat3 = st.columns(3)
     
     with col_stat1:
-        st.metric("Total Sessions", total_sessions)
+        st.metric("Total Sessions", metrics['total_sessions'])
     with col_stat2:
-        st.metric("Total Hours", f"{total_hours:.1f}")
+        st.metric("Total Hours", f"{metrics['total_hours']:.1f}")
     with col_stat3:
-        tech_count = len(db.get_all_tech_stack())
+        tech_count = len(CachedQueryService.get_all_tech_stack(db))
         st.metric("Technologies", tech_count)
@@ -4,87 +4,89 @@ Displays progress, goals, and completion tracking.
 """
 
 import streamlit as st
-from src.database.operations import DatabaseStorage
+from operator import itemgetter
+from src.services.cached_queries import CachedQueryService, get_database
+from src.utils.navigation import back_to_home_button
+
+_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
+    <h1 style="color: #FFD700; margin: 0; text-align: center;">📋 Learning Roadmap</h1>
+    <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">Your Technologies Grouped by Category</p>
+</div>
+"""
 
 def show_planning_page():
     """Display dynamic learning roadmap grouped by category."""
     # Header with MG branding
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
-        <h1 style="color: #FFD700; margin: 0; text-align: center;">📋 Learning Roadmap</h1>
-        <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">Your Technologies Grouped by Category</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Back button
-    if st.button("← Back to Home", help="Return to main page"):
-        st.session_state.current_page = "home_v2"
-        st.rerun()
+    back_to_home_button()
     
-    # Initialize database
-    if 'db' not in st.session_state:
-        st.session_state.db = DatabaseStorage()
-    
-    db = st.session_state.db
+    db = get_database()
     
     st.markdown("---")
     
-    # Get data from database
-    tech_stack = db.get_all_tech_stack()
+    # Tech stack rows with logged hours already joined in, from the same cached
+    # aggregate the Tech Stack page uses
+    tech_stack = CachedQueryService.get_tech_stack_with_metrics(db)
     
     if not tech_stack:
         st.info("📚 No technologies added yet. Visit the **Tech Stack** page to add your first technology!")
         return
     
-    # Calculate hours for each technology from sessions
-    tech_hours = {}
-    all_sessions = db.get_all_sessions()
-    for session in all_sessions:
-        tech_name = session.get('technology', '')
-        hours = session.get('hours_spent', 0)
-        tech_hours[tech_name] = tech_hours.get(tech_name, 0) + hours
-    
-    # Group technologies by category
+    # Group technologies by category, accumulating category and overall totals as we go
     categories_data = {}
+    total_goal = 0
     for tech in tech_stack:
         tech_name = tech['name']
         category = tech.get('category', '❓ Uncategorized')
+        logged_hours = tech['logged_hours']
+        goal_hours = tech.get('goal_hours', 50)
+        total_goal += tech.get('goal_hours', 0)
         
         if category not in categories_data:
-            categories_data[category] = []
+            categories_data[category] = {'techs': [], 'logged': 0, 'goal': 0}
         
-        categories_data[category].append({
+        cat_data = categories_data[category]
+        cat_data['techs'].append({
             'name': tech_name,
-            'logged_hours': tech_hours.get(tech_name, 0),
-            'goal_hours': tech.get('goal_hours', 50)
+            'logged_hours': logged_hours,
+            'goal_hours': goal_hours
         })
+        cat_data['logged'] += logged_hours
+        cat_data['goal'] += goal_hours
     
     # Display categories
     st.markdown("### 🗂️ Technologies by Category")
     
-    for category, techs in sorted(categories_data.items()):
-        # Calculate category totals
-        category_logged = sum(t['logged_hours'] for t in techs)
-        category_goal = sum(t['goal_hours'] for t in techs)
+    for category, cat_data in sorted(categories_data.items()):
+        techs = cat_data['techs']
+        category_logged = cat_data['logged']
+        category_goal = cat_data['goal']
         category_progress = (category_logged / category_goal * 100) if category_goal > 0 else 0
         
         with st.expander(f"{category} ({len(techs)} technologies - {category_progress:.0f}% complete)", expanded=True):
-            st.markdown(f"**Category Progress:** {category_logged:.1f}h / {category_goal:.1f}h")
-            st.progress(min(category_progress / 100, 1.0))
+            # Label and bar as one element (progress text renders markdown)
+            st.progress(
+                min(category_progress / 100, 1.0),
+                text=f"**Category Progress:** {category_logged:.1f}h / {category_goal:.1f}h"
+            )
             
             st.markdown("---")
             
             # Display each technology in the category
-            for tech in sorted(techs, key=lambda x: x['name']):
+            for tech in sorted(techs, key=itemgetter('name')):
                 tech_progress = (tech['logged_hours'] / tech['goal_hours'] * 100) if tech['goal_hours'] > 0 else 0
                 remaining_hours = max(0, tech['goal_hours'] - tech['logged_hours'])
                 
                 col1, col2 = st.columns([2, 1])
                 
                 with col1:
-                    st.markdown(f"**{tech['name']}**")
-                    st.progress(min(tech_progress / 100, 1.0))
-                    st.caption(f"{tech['logged_hours']:.1f}h logged / {tech['goal_hours']:.1f}h goal ({tech_progress:.0f}%)")
+                    st.progress(
+                        min(tech_progress / 100, 1.0),
+                        text=f"**{tech['name']}** · {tech['logged_hours']:.1f}h logged / {tech['goal_hours']:.1f}h goal ({tech_progress:.0f}%)"
+                    )
                 
                 with col2:
                     if remaining_hours > 0:
@@ -96,8 +98,8 @@ def show_planning_page():
     st.markdown("---")
     st.markdown("### 📊 Overall Summary")
     
-    total_logged = sum(tech_hours.values())
-    total_goal = sum(tech.get('goal_hours', 0) for tech in tech_stack)
+    # All logged hours, including technologies not (yet) in the stack
+    total_logged = CachedQueryService.get_dashboard_metrics(db)['total_hours']
     total_progress = (total_logged / total_goal * 100) if total_goal > 0 else 0
     
     col1, col2, col3, col4 = st.columns(4)
@@ -3,60 +3,117 @@ Sessions Page - View, edit, and manage all learning sessions.
 Provides filtering, sorting, and detailed session analytics.
 """
 
+import math
 import streamlit as st
 import pandas as pd
 from src.database.operations import DatabaseStorage
-from src.services import CachedQueryService
+from src.services import CachedQueryService, get_database
+from src.utils.navigation import back_to_home_button, set_state
 import logging
 
+_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
+    <h1 style="color: #FFD700; margin: 0; text-align: center;">📚 Sessions Manager</h1>
+    <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">View & Edit Your Learning Sessions</p>
+</div>
+"""
+
+# Sort label -> (column, ascending)
+SORT_SPECS = {
+    'Date (Newest)': ('date', False),
+    'Date (Oldest)': ('date', True),
+    'Hours (Most)': ('hours', False),
+    'Hours (Least)': ('hours', True),
+}
+SORT_OPTIONS = tuple(SORT_SPECS)
+PRESORTED_OPTION = 'Date (Newest)'  # matches get_all_sessions() ordering
+SESSIONS_PER_PAGE = 25
+
+def _sessions_csv(sessions_df: pd.DataFrame) -> bytes:
+    """Encode the displayed sessions as CSV bytes."""
+    return sessions_df.to_csv(index=False).encode('utf-8')
+
+@st.fragment
+def _render_session_list(filtered_df: pd.DataFrame, db: DatabaseStorage):
+    """Render the session rows; opening/closing a row reruns only this fragment."""
+    # Only the opened session renders its details and actions; every other
+    # row is a single toggle button instead of a hidden expander body
+    expanded_session = st.session_state.get('expanded_session')
+    
+    # Long lists are paged so each rerun only builds one page of row widgets
+    page_df = filtered_df
+    total_rows = len(filtered_df)
+    if total_rows > SESSIONS_PER_PAGE:
+        page_count = math.ceil(total_rows / SESSIONS_PER_PAGE)
+        # A narrower filter can leave the remembered page past the end
+        if st.session_state.get('sessions_page', 1) > page_count:
+            st.session_state.sessions_page = page_count
+        page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key="sessions_page")
+        start = (page - 1) * SESSIONS_PER_PAGE
+        page_df = filtered_df.iloc[start:start + SESSIONS_PER_PAGE]
+        st.caption(f"Showing {start + 1}-{start + len(page_df)} of {total_rows} sessions")
+    
+    # itertuples yields lightweight rows straight from the frame's columns
+    for session in page_df.itertuples(index=False):
+        session_id = int(session.session_id)
+        is_open = session_id == expanded_session
+        
+        st.button(
+            f"{'▾' if is_open else '▸'} 📅 {session.date} - {session.technology} - {session.topic or 'No topic'}",
+            key=f"toggle_{session_id}",
+            on_click=set_state,
+            args=('expanded_session', None if is_open else session_id),
+            use_container_width=True
+        )
+        
+        if is_open:
+            col_info, col_actions = st.columns([3, 1])
+            
+            with col_info:
+                # One markdown element instead of an st.write per line
+                detail_lines = [
+                    f"**Type:** {session.type} | **Hours:** {session.hours} | **Status:** {session.status}",
+                    f"**Difficulty:** {session.difficulty}"
+                ]
+                if session.tags:
+                    detail_lines.append(f"**Tags:** {session.tags}")
+                if session.notes:
+                    detail_lines.append(f"**Notes:** {session.notes}")
+                st.markdown("  \n".join(detail_lines))
+            
+            with col_actions:
+                if st.button("🗑️ Delete", key=f"delete_{session_id}"):
+                    db.delete_session(session_id)
+                    CachedQueryService.invalidate_cache()  # Refresh dashboard
+                    st.session_state.expanded_session = None
+                    st.success("Session deleted!")
+                    st.rerun()  # Full app rerun so counts, filters and export refresh
+
 def show_sessions_page():
     """Display the Personal Development Dashboard / Sessions page."""
     # Header with MG branding
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
-        <h1 style="color: #FFD700; margin: 0; text-align: center;">📚 Sessions Manager</h1>
-        <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">View & Edit Your Learning Sessions</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Back button
-    if st.button("← Back to Home", help="Return to main page"):
-        st.session_state.current_page = "home_v2"
-        st.rerun()
+    back_to_home_button()
     
-    # Initialize database
-    if 'db' not in st.session_state:
-        st.session_state.db = DatabaseStorage()
+    db = get_database()
     
-    db = st.session_state.db
+    # Load all sessions as a cached DataFrame; metrics, filter options and
+    # filtering all reuse it
+    df = CachedQueryService.get_sessions_dataframe(db)
     
-    # Load all sessions from database
-    all_sessions = db.get_all_sessions()
-    
-    # Transform for display
-    if all_sessions:
-        sessions_display = []
-        for session in all_sessions:
-            sessions_display.append({
-                'session_id': session.get('session_id'),
-                'date': session.get('session_date', ''),
-                'technology': session.get('technology', ''),
-                'topic': session.get('skill_topic', ''),
-                'type': session.get('session_type', ''),
-                'difficulty': session.get('difficulty', ''),
-                'status': session.get('status', ''),
-                'hours': session.get('hours_spent', 0),
-                'tags': session.get('tags', ''),
-                'notes': session.get('notes', '')
-            })
-        
+    if not df.empty:
         # Dashboard metrics
         st.markdown("### 📊 Session Metrics")
         col1, col2, col3, col4 = st.columns(4)
         
-        total_sessions = len(sessions_display)
-        total_hours = sum(s['hours'] for s in sessions_display)
-        completed_sessions = len([s for s in sessions_display if s.get("status") == "Completed"])
+        # Totals come from the shared cached aggregate query, not extra passes
+        # over the frame
+        metrics = CachedQueryService.get_dashboard_metrics(db)
+        total_sessions = metrics['total_sessions']
+        total_hours = metrics['total_hours']
+        completed_sessions = metrics['completed_sessions']
         completion_rate = (completed_sessions / total_sessions * 100) if total_sessions > 0 else 0
         
         with col1:
@@ -73,10 +130,11 @@ def show_sessions_page():
         # Filters
         st.markdown("### 🔍 Filters & Sorting")
         
-        df_temp = pd.DataFrame(sessions_display)
-        unique_technologies = ['All'] + sorted(df_temp['technology'].unique().tolist())
-        unique_types = ['All'] + sorted(df_temp['type'].unique().tolist())
-        unique_statuses = ['All'] + sorted(df_temp['status'].unique().tolist())
+        # Distinct values are cached alongside the frame, not recomputed per rerun
+        filter_options = CachedQueryService.get_session_filter_options(db)
+        unique_technologies = ['All'] + filter_options['technology']
+        unique_types = ['All'] + filter_options['type']
+        unique_statuses = ['All'] + filter_options['status']
         
         col_filter1, col_filter2, col_filter3, col_sort = st.columns(4)
         
@@ -90,63 +148,52 @@ def show_sessions_page():
             status_filter = st.selectbox("Status", unique_statuses, key="status_filter")
         
         with col_sort:
-            sort_options = ['Date (Newest)', 'Date (Oldest)', 'Hours (Most)', 'Hours (Least)']
-            sort_by = st.selectbox("Sort By", sort_options, key="sort_filter")
-        
-        # Apply filters
-        filtered_sessions = sessions_display.copy()
-        
-        if tech_filter != 'All':
-            filtered_sessions = [s for s in filtered_sessions if s['technology'] == tech_filter]
-        
-        if type_filter != 'All':
-            filtered_sessions = [s for s in filtered_sessions if s['type'] == type_filter]
-        
-        if status_filter != 'All':
-            filtered_sessions = [s for s in filtered_sessions if s['status'] == status_filter]
-        
-        # Apply sorting
-        if sort_by == 'Date (Newest)':
-            filtered_sessions = sorted(filtered_sessions, key=lambda x: x['date'], reverse=True)
-        elif sort_by == 'Date (Oldest)':
-            filtered_sessions = sorted(filtered_sessions, key=lambda x: x['date'])
-        elif sort_by == 'Hours (Most)':
-            filtered_sessions = sorted(filtered_sessions, key=lambda x: x['hours'], reverse=True)
-        elif sort_by == 'Hours (Least)':
-            filtered_sessions = sorted(filtered_sessions, key=lambda x: x['hours'])
+            sort_by = st.selectbox("Sort By", SORT_OPTIONS, key="sort_filter")
+        
+        # Apply filters as one combined boolean mask; with no active filter the
+        # cached frame is used as-is instead of being copied through df[mask]
+        active_filters = {
+            column: value
+            for column, value in (('technology', tech_filter), ('type', type_filter), ('status', status_filter))
+            if value != 'All'
+        }
+        
+        filtered_df = df
+        if active_filters:
+            mask = pd.Series(True, index=df.index)
+            for column, value in active_filters.items():
+                mask &= df[column] == value
+            filtered_df = df[mask]
+        
+        # Apply sorting (stable, so ties keep the database order like sorted() did).
+        # The frame already arrives newest-first (ORDER BY session_date DESC),
+        # so the default order needs no sort at all.
+        if sort_by != PRESORTED_OPTION:
+            sort_column, ascending = SORT_SPECS[sort_by]
+            filtered_df = filtered_df.sort_values(sort_column, ascending=ascending, kind='stable')
         
         # Display sessions
         st.markdown("---")
-        st.markdown(f"### 📋 Sessions ({len(filtered_sessions)} shown)")
-        
-        for session in filtered_sessions:
-            with st.expander(f"📅 {session['date']} - {session['technology']} - {session['topic'] or 'No topic'}", expanded=False):
-                col_info, col_actions = st.columns([3, 1])
-                
-                with col_info:
-                    st.write(f"**Type:** {session['type']} | **Hours:** {session['hours']} | **Status:** {session['status']}")
-                    st.write(f"**Difficulty:** {session['difficulty']}")
-                    if session.get('tags'):
-                        st.write(f"**Tags:** {session['tags']}")
-                    if session.get('notes'):
-                        st.write(f"**Notes:** {session['notes']}")
-                
-                with col_actions:
-                    if st.button("🗑️ Delete", key=f"delete_{session['session_id']}"):
-                        db.delete_session(session['session_id'])
-                        CachedQueryService.invalidate_cache()  # Refresh dashboard
-                        st.success("Session deleted!")
-                        st.rerun()
-        
-        # Export to CSV
+        st.markdown(f"### 📋 Sessions ({len(filtered_df)} shown)")
+        
+        _render_session_list(filtered_df, db)
+        
+        # Export to CSV: the file is only built on request. The prepared bytes
+        # are kept with the view they came from, so the Download click's rerun
+        # keeps the button, and a changed filter or sort drops the stale file.
+        export_view = (tech_filter, type_filter, status_filter, sort_by)
         if st.button("💾 Export to CSV"):
-            df_export = pd.DataFrame(filtered_sessions)
-            csv = df_export.to_csv(index=False)
+            st.session_state.sessions_export = (export_view, _sessions_csv(filtered_df))
+        
+        prepared_export = st.session_state.get('sessions_export')
+        if prepared_export and prepared_export[0] == export_view:
             st.download_button(
                 label="📥 Download CSV",
-                data=csv,
+                data=prepared_export[1],
                 file_name="learning_sessions.csv",
-                mime="text/csv"
+                mime="text/csv",
+                on_click=set_state,
+                args=('sessions_export', None)
             )
     else:
         st.info("📚 No sessions found. Go to **Log Session** to add your first session!")
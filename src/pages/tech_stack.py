@@ -3,31 +3,105 @@ Tech Stack Dashboard - Visual overview of technologies with KPIs.
 Read-only display showing technology cards grouped by category with progress metrics.
 """
 
+import math
 import streamlit as st
-from src.database.operations import DatabaseStorage
-from src.services.cached_queries import CachedQueryService
+from operator import itemgetter
+from src.services.cached_queries import CachedQueryService, get_database
+from src.utils.navigation import back_to_home_button
+
+_HEADER_HTML = """
+<div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
+    <h1 style="color: #FFD700; margin: 0; text-align: center;">🎯 Tech Stack Dashboard</h1>
+    <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">Visual Overview of Your Learning Journey</p>
+</div>
+"""
+
+_EMPTY_STATE_HTML = """
+<div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); padding: 2rem; border-radius: 15px; border: 2px solid #FFD700; text-align: center;">
+    <h3 style="color: #FFD700; margin: 0;">📚 No Technologies Yet</h3>
+    <p style="color: #C0C0C0; margin: 1rem 0;">Add your first technology in the Dropdown Manager to start tracking your learning progress!</p>
+</div>
+"""
+
+_STAT_CELL_TEMPLATE = (
+    '<div style="flex: 1;">'
+    '<p style="color: #C0C0C0; margin: 0; font-size: 0.85rem;">{label}</p>'
+    '<p style="color: #FFFFFF; margin: 0.2rem 0 0 0; font-size: 1.4rem; font-weight: bold;">{value}</p>'
+    '</div>'
+)
+
+# Ragged last rows are handled by auto-fill, so no placeholder cells are needed
+_CARD_GRID_TEMPLATE = (
+    '<div style="display: grid; grid-template-columns: repeat(auto-fill, minmax(340px, 1fr)); gap: 1rem;">\n'
+    '{cards}\n'
+    '</div>'
+)
+
+# (minimum progress %, border/bar color, emoji), highest tier first
+_PROGRESS_TIERS = (
+    (100, "#00FF00", "✅"),
+    (75, "#FFD700", "🟡"),
+    (25, "#FFA500", "🟠"),
+    (-math.inf, "#FF4500", "🔴"),
+)
+
+
+def _tech_card_html(tech):
+    """Build the complete card markup (header, stats, progress bar, status) for one technology."""
+    tech_name = tech['name']
+    goal_hours = tech.get('goal_hours', 50)
+    logged_hours = tech.get('logged_hours', 0)
+    progress_pct = tech.get('progress_pct', 0)
+    session_count = tech.get('session_count', 0)
+    date_added = tech.get('date_added', 'Unknown')
+    hours_remaining = max(0, goal_hours - logged_hours)
+    
+    progress_color, status_emoji = next(
+        tier for threshold, *tier in _PROGRESS_TIERS if progress_pct >= threshold
+    )
+    if progress_pct >= 100:
+        status_color, status_message = "#00FF00", "🎉 Goal completed! Great work!"
+    elif progress_pct >= 75:
+        status_color, status_message = "#00CED1", f"🚀 Almost there! {hours_remaining:.1f} hours to go"
+    elif progress_pct > 0:
+        status_color, status_message = "#FFA500", f"💪 Keep going! {hours_remaining:.1f} hours remaining"
+    else:
+        status_color, status_message = "#C0C0C0", "🆕 No sessions logged yet - time to start learning!"
+    
+    stats_html = "".join(
+        _STAT_CELL_TEMPLATE.format(label=label, value=value)
+        for label, value in (
+            ("🎯 Goal", f"{goal_hours:.0f}h"),
+            ("⏱️ Logged", f"{logged_hours:.1f}h"),
+            ("📝 Sessions", session_count),
+            ("⏳ Remaining", f"{hours_remaining:.1f}h"),
+        )
+    )
+    
+    return f"""<div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); padding: 1.5rem; border-radius: 12px; border: 2px solid {progress_color}; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);">
+    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
+        <h3 style="color: #FFD700; margin: 0;">{status_emoji} {tech_name}</h3>
+        <span style="color: {progress_color}; font-size: 1.2rem; font-weight: bold;">{progress_pct:.1f}%</span>
+    </div>
+    <p style="color: #C0C0C0; margin: 0.5rem 0; font-size: 0.9rem;">📅 Added: {date_added}</p>
+    <div style="display: flex; justify-content: space-between; gap: 1rem; margin-top: 1rem;">{stats_html}</div>
+    <div style="background: #0f3460; border-radius: 6px; height: 8px; overflow: hidden; margin-top: 1rem;">
+        <div style="background: {progress_color}; width: {min(progress_pct, 100):.1f}%; height: 100%;"></div>
+    </div>
+    <p style="color: {status_color}; margin: 0.75rem 0 0 0; font-size: 0.9rem;">{status_message}</p>
+</div>"""
+
 
 def show_tech_stack_crud_page():
     """Display the Tech Stack visual dashboard."""
     
     # Header with MG branding
-    st.markdown("""
-    <div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 50%, #0f3460 100%); padding: 1.5rem; border-radius: 15px; margin-bottom: 2rem; border: 2px solid #FFD700;">
-        <h1 style="color: #FFD700; margin: 0; text-align: center;">🎯 Tech Stack Dashboard</h1>
-        <p style="color: #C0C0C0; text-align: center; margin: 0.5rem 0 0 0;">Visual Overview of Your Learning Journey</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
     
     # Back button
-    if st.button("← Back to Home", help="Return to main page"):
-        st.session_state.current_page = "home_v2"
-        st.rerun()
-    
-    # Initialize database
-    if 'db' not in st.session_state:
-        st.session_state.db = DatabaseStorage()
+    back_to_home_button()
     
-    db = st.session_state.db
+    db = get_database()
     
     # Info banner
     st.info("📝 **Note:** To add or edit technologies, use the Dropdown Manager page")
@@ -38,19 +112,33 @@ def show_tech_stack_crud_page():
     tech_stack = CachedQueryService.get_tech_stack_with_metrics(db)
     
     if not tech_stack:
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); padding: 2rem; border-radius: 15px; border: 2px solid #FFD700; text-align: center;">
-            <h3 style="color: #FFD700; margin: 0;">📚 No Technologies Yet</h3>
-            <p style="color: #C0C0C0; margin: 1rem 0;">Add your first technology in the Dropdown Manager to start tracking your learning progress!</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_EMPTY_STATE_HTML, unsafe_allow_html=True)
     else:
-        # Display summary KPIs
+        # Aggregate overall KPIs and per-category totals in one pass. Walking the
+        # stack in logged-hours order leaves every category's card list pre-sorted.
         total_tech_count = len(tech_stack)
-        total_goal_hours = sum(tech.get('goal_hours', 0) for tech in tech_stack)
-        total_logged_hours = sum(tech.get('logged_hours', 0) for tech in tech_stack)
-        total_sessions = sum(tech.get('session_count', 0) for tech in tech_stack)
-        avg_progress = sum(tech.get('progress_pct', 0) for tech in tech_stack) / len(tech_stack) if tech_stack else 0
+        total_goal_hours = 0
+        total_logged_hours = 0
+        total_sessions = 0
+        total_progress = 0
+        by_category = {}
+        for tech in sorted(tech_stack, key=itemgetter('logged_hours'), reverse=True):
+            logged_hours = tech['logged_hours']
+            session_count = tech['session_count']
+            total_goal_hours += tech.get('goal_hours', 0)
+            total_logged_hours += logged_hours
+            total_sessions += session_count
+            total_progress += tech.get('progress_pct', 0)
+            
+            cat = tech.get('category', '❓ Uncategorized')
+            if cat not in by_category:
+                by_category[cat] = {'category': cat, 'technologies': 0, 'hours': 0, 'sessions': 0, 'techs': []}
+            cat_info = by_category[cat]
+            cat_info['technologies'] += 1
+            cat_info['hours'] += logged_hours
+            cat_info['sessions'] += session_count
+            cat_info['techs'].append(tech)
+        avg_progress = total_progress / total_tech_count
         
         # Top KPI metrics
         st.markdown("### 📊 Overall Statistics")
@@ -69,83 +157,20 @@ def show_tech_stack_crud_page():
         
         st.markdown("---")
         
-        # Group technologies by category
-        by_category = {}
-        for tech in tech_stack:
-            cat = tech.get('category', '❓ Uncategorized')
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(tech)
-        
         # Display technologies as visual cards grouped by category
         st.markdown("### 🗂️ Technologies by Category")
         
-        for category, techs in sorted(by_category.items()):
+        for category, cat_info in sorted(by_category.items()):
             # Category header
             st.markdown(f"#### {category}")
-            st.caption(f"{len(techs)} technologies • {sum(t.get('logged_hours', 0) for t in techs):.1f} hours logged")
+            st.caption(f"{cat_info['technologies']} technologies • {cat_info['hours']:.1f} hours logged")
             
-            # Display technology cards in a grid
-            for tech in sorted(techs, key=lambda x: x.get('logged_hours', 0), reverse=True):
-                tech_name = tech['name']
-                goal_hours = tech.get('goal_hours', 50)
-                logged_hours = tech.get('logged_hours', 0)
-                progress_pct = tech.get('progress_pct', 0)
-                session_count = tech.get('session_count', 0)
-                date_added = tech.get('date_added', 'Unknown')
-                
-                # Determine progress color
-                if progress_pct >= 100:
-                    progress_color = "#00FF00"
-                    status_emoji = "✅"
-                elif progress_pct >= 75:
-                    progress_color = "#FFD700"
-                    status_emoji = "🟡"
-                elif progress_pct >= 25:
-                    progress_color = "#FFA500"
-                    status_emoji = "🟠"
-                else:
-                    progress_color = "#FF4500"
-                    status_emoji = "🔴"
-                
-                # Technology card
-                st.markdown(f"""
-                <div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); padding: 1.5rem; border-radius: 12px; border: 2px solid {progress_color}; margin-bottom: 1.5rem; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.3);">
-                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 1rem;">
-                        <h3 style="color: #FFD700; margin: 0;">{status_emoji} {tech_name}</h3>
-                        <span style="color: {progress_color}; font-size: 1.2rem; font-weight: bold;">{progress_pct:.1f}%</span>
-                    </div>
-                    <p style="color: #C0C0C0; margin: 0.5rem 0; font-size: 0.9rem;">📅 Added: {date_added}</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                # Metrics row
-                col_a, col_b, col_c, col_d = st.columns(4)
-                
-                with col_a:
-                    st.metric("🎯 Goal", f"{goal_hours:.0f}h")
-                with col_b:
-                    st.metric("⏱️ Logged", f"{logged_hours:.1f}h")
-                with col_c:
-                    st.metric("📝 Sessions", session_count)
-                with col_d:
-                    hours_remaining = max(0, goal_hours - logged_hours)
-                    st.metric("⏳ Remaining", f"{hours_remaining:.1f}h")
-                
-                # Progress bar
-                st.progress(min(progress_pct / 100, 1.0))
-                
-                # Status message
-                if progress_pct >= 100:
-                    st.success("🎉 Goal completed! Great work!")
-                elif progress_pct >= 75:
-                    st.info(f"🚀 Almost there! {hours_remaining:.1f} hours to go")
-                elif progress_pct > 0:
-                    st.warning(f"💪 Keep going! {hours_remaining:.1f} hours remaining")
-                else:
-                    st.caption("🆕 No sessions logged yet - time to start learning!")
-                
-                st.markdown("---")
+            # Display technology cards as one CSS grid per category
+            cards_html = "\n".join(
+                _tech_card_html(tech)
+                for tech in cat_info['techs']
+            )
+            st.markdown(_CARD_GRID_TEMPLATE.format(cards=cards_html), unsafe_allow_html=True)
             
             st.markdown("")  # Add spacing between categories
         
@@ -153,19 +178,8 @@ def show_tech_stack_crud_page():
         st.markdown("---")
         st.markdown("### 📈 Category Breakdown")
         
-        category_data = []
-        for cat, techs in by_category.items():
-            cat_hours = sum(t.get('logged_hours', 0) for t in techs)
-            cat_sessions = sum(t.get('session_count', 0) for t in techs)
-            category_data.append({
-                'category': cat,
-                'technologies': len(techs),
-                'hours': cat_hours,
-                'sessions': cat_sessions
-            })
-        
         # Sort by hours logged
-        category_data.sort(key=lambda x: x['hours'], reverse=True)
+        category_data = sorted(by_category.values(), key=itemgetter('hours'), reverse=True)
         
         for cat_info in category_data:
             with st.expander(f"**{cat_info['category']}** - {cat_info['hours']:.1f}h logged", expanded=False):
@@ -3,6 +3,6 @@ Services package - Business logic and data synchronization layer.
 """
 
 from .sync_service import TechnologySyncService, CategorySyncService
-from .cached_queries import CachedQueryService
+from .cached_queries import CachedQueryService, get_database
 
-__all__ = ['TechnologySyncService', 'CategorySyncService', 'CachedQueryService']
+__all__ = ['TechnologySyncService', 'CategorySyncService', 'CachedQueryService', 'get_database']
@@ -4,10 +4,38 @@ Uses Streamlit's @st.cache_data decorator for performance optimization.
 """
 
 import streamlit as st
-from typing import Dict, List, Any
+import psycopg2.extras
+from typing import TYPE_CHECKING, Dict, List, Any
 from src.database.operations import DatabaseStorage
 import logging
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# sessions table column -> sessions DataFrame column, in display order
+SESSION_DISPLAY_COLUMNS = {
+    'session_id': 'session_id',
+    'session_date': 'date',
+    'technology': 'technology',
+    'skill_topic': 'topic',
+    'session_type': 'type',
+    'difficulty': 'difficulty',
+    'status': 'status',
+    'hours_spent': 'hours',
+    'tags': 'tags',
+    'notes': 'notes',
+}
+
+def get_database() -> DatabaseStorage:
+    """
+    DatabaseStorage for the current browser session.
+    Each session keeps its own connection so one user's failed transaction
+    or rollback never touches another user's writes.
+    """
+    if 'db' not in st.session_state:
+        st.session_state.db = DatabaseStorage()
+    return st.session_state.db
+
 class CachedQueryService:
     """Provides cached and batched database queries."""
     
@@ -56,6 +84,34 @@ class CachedQueryService:
         logging.info(f"CachedQueryService: Fetched {len(results)} tech stack entries with metrics (cached)")
         return results
     
+    @staticmethod
+    @st.cache_data(ttl=60, show_spinner=False)
+    def get_all_tech_stack(_db: DatabaseStorage) -> List[Dict[str, Any]]:
+        """Cached tech stack rows, shared across reruns and browser sessions."""
+        return _db.get_all_tech_stack()
+    
+    @staticmethod
+    @st.cache_data(ttl=60, show_spinner=False)
+    def get_sessions_dataframe(_db: DatabaseStorage) -> "pd.DataFrame":
+        """Cached DataFrame of all sessions, with columns named for display."""
+        import pandas as pd  # deferred so pages without tables skip the import
+        
+        # Rows always carry every sessions column, so let pandas pick the
+        # columns straight from the records instead of a per-row .get() dict
+        sessions = _db.get_all_sessions()
+        df = pd.DataFrame.from_records(sessions, columns=list(SESSION_DISPLAY_COLUMNS))
+        return df.rename(columns=SESSION_DISPLAY_COLUMNS)
+    
+    @staticmethod
+    @st.cache_data(ttl=60, show_spinner=False)
+    def get_session_filter_options(_db: DatabaseStorage) -> Dict[str, List[str]]:
+        """Sorted distinct technology/type/status values for the sessions filters."""
+        df = CachedQueryService.get_sessions_dataframe(_db)
+        return {
+            column: sorted(df[column].dropna().unique().tolist())
+            for column in ('technology', 'type', 'status')
+        }
+    
     @staticmethod
     @st.cache_data(ttl=60, show_spinner=False)
     def get_dropdown_values_cached(_db: DatabaseStorage, field_name: str, parent_field: str = "", 
@@ -98,13 +154,15 @@ class CachedQueryService:
         conn = _db._get_connection()
         cursor = conn.cursor()
         
-        # Get aggregated stats
+        # Get aggregated stats (one scan; session_id is the primary key, so a
+        # plain COUNT(*) needs no DISTINCT)
         cursor.execute('''
             SELECT 
-                COUNT(DISTINCT session_id) as total_sessions,
+                COUNT(*) as total_sessions,
                 SUM(hours_spent) as total_hours,
                 COUNT(DISTINCT technology) as tech_count,
-                COUNT(DISTINCT category_name) as category_count
+                COUNT(DISTINCT category_name) as category_count,
+                COUNT(*) FILTER (WHERE status = 'Completed') as completed_sessions
             FROM sessions
         ''')
         
@@ -114,7 +172,8 @@ class CachedQueryService:
             'total_sessions': row[0] or 0,
             'total_hours': row[1] or 0.0,
             'tech_count': row[2] or 0,
-            'category_count': row[3] or 0
+            'category_count': row[3] or 0,
+            'completed_sessions': row[4] or 0
         }
     
     @staticmethod
@@ -128,16 +187,16 @@ class CachedQueryService:
     def get_sessions_with_details(_db: DatabaseStorage, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """Get sessions with pagination (cached)."""
         conn = _db._get_connection()
-        cursor = conn.cursor()
+        cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
         
+        # Only the requested page of rows leaves the database
         cursor.execute('''
             SELECT * FROM sessions 
             ORDER BY session_date DESC, created_at DESC
             LIMIT %s OFFSET %s
         ''', (limit, offset))
         
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+        return [dict(row) for row in cursor.fetchall()]
     
     @staticmethod
     @st.cache_data(ttl=60, show_spinner=False)
@@ -210,6 +269,12 @@ class CachedQueryService:
         
         return {row[0]: row[1] for row in cursor.fetchall()}
     
+    @staticmethod
+    @st.cache_data(ttl=60, show_spinner=False)
+    def get_session_type_breakdown(_db: DatabaseStorage) -> Dict[str, float]:
+        """Cached hours per session type (Studying, Practice, ...)."""
+        return _db.get_session_type_breakdown()
+    
     @staticmethod
     @st.cache_data(ttl=60, show_spinner=False)
     def get_category_analytics(_db: DatabaseStorage) -> List[Dict[str, Any]]:
@@ -327,8 +392,9 @@ class CachedQueryService:
             ORDER BY s.work_item, hours DESC
         ''')
         
-        # Organize by work item
+        # Organize by work item; skill entries are indexed by name per work item
         work_item_data = {}
+        skill_index = {}
         for row in cursor.fetchall():
             work_item = row[0]
             tech_name = row[1]
@@ -347,6 +413,7 @@ class CachedQueryService:
                     'practice_hours': 0,
                     'skills': []
                 }
+                skill_index[work_item] = {}
             
             work_item_data[work_item]['total_hours'] += hours
             work_item_data[work_item]['total_sessions'] += sessions
@@ -357,15 +424,17 @@ class CachedQueryService:
                 work_item_data[work_item]['practice_hours'] += hours
             
             # Add skill if not already there
-            existing_skill = next((s for s in work_item_data[work_item]['skills'] if s['name'] == skill), None)
+            existing_skill = skill_index[work_item].get(skill)
             if existing_skill:
                 existing_skill['hours'] += hours
                 existing_skill['sessions'] += sessions
             else:
-                work_item_data[work_item]['skills'].append({
+                new_skill = {
                     'name': skill,
                     'hours': hours,
                     'sessions': sessions
-                })
+                }
+                skill_index[work_item][skill] = new_skill
+                work_item_data[work_item]['skills'].append(new_skill)
         
         return list(work_item_data.values())
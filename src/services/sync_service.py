@@ -49,8 +49,7 @@ class TechnologySyncService:
         """Update technology in BOTH tables and update all sessions using it."""
         try:
             # Get current tech data
-            tech_stack = self.db.get_all_tech_stack()
-            current_tech = next((t for t in tech_stack if t['id'] == tech_id), None)
+            current_tech = self.db.get_technology_by_id(tech_id)
             
             if not current_tech:
                 return {'success': False, 'message': 'Technology not found'}
@@ -92,8 +91,7 @@ class TechnologySyncService:
         """Delete technology with safety checks - verify session usage first."""
         try:
             # Get tech data
-            tech_stack = self.db.get_all_tech_stack()
-            tech = next((t for t in tech_stack if t['id'] == tech_id), None)
+            tech = self.db.get_technology_by_id(tech_id)
             
             if not tech:
                 return {'success': False, 'message': 'Technology not found'}
@@ -129,8 +127,7 @@ class TechnologySyncService:
     def force_delete_technology(self, tech_id: int) -> Dict[str, Any]:
         """Force delete technology even if used in sessions (marks sessions as 'Deleted: <name>')."""
         try:
-            tech_stack = self.db.get_all_tech_stack()
-            tech = next((t for t in tech_stack if t['id'] == tech_id), None)
+            tech = self.db.get_technology_by_id(tech_id)
             
             if not tech:
                 return {'success': False, 'message': 'Technology not found'}
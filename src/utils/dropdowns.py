@@ -6,6 +6,12 @@ Supports both hierarchical management (with auto-save) and simplified session en
 import streamlit as st
 from typing import List, Dict, Optional, Tuple
 from src.database.operations import DatabaseStorage
+from src.services.cached_queries import CachedQueryService
+
+# Fixed options for independent dropdowns (tuples: built once at import, never mutated)
+SESSION_TYPE_OPTIONS = ('Studying', 'Practice')
+DIFFICULTY_OPTIONS = ('Beginner', 'Intermediate', 'Advanced', 'Expert')
+STATUS_OPTIONS = ('Planned', 'In Progress', 'Completed', 'Blocked')
 
 
 class DropdownManager:
@@ -28,10 +34,10 @@ class DropdownManager:
         
         # Independent dropdown fields
         self.independent_fields = {
-            'session_type': {'label': '📝 Session Type', 'options': ['Studying', 'Practice']},
+            'session_type': {'label': '📝 Session Type', 'options': SESSION_TYPE_OPTIONS},
             'category_source': {'label': '📚 Category Source', 'placeholder': 'Course, docs, project...'},
-            'difficulty': {'label': '⚡ Difficulty', 'options': ['Beginner', 'Intermediate', 'Advanced', 'Expert']},
-            'status': {'label': '✅ Status', 'options': ['Planned', 'In Progress', 'Completed', 'Blocked']}
+            'difficulty': {'label': '⚡ Difficulty', 'options': DIFFICULTY_OPTIONS},
+            'status': {'label': '✅ Status', 'options': STATUS_OPTIONS}
         }
     
     # ========== HIERARCHICAL MANAGEMENT MODE (Auto-save) ==========
@@ -246,7 +252,7 @@ class DropdownManager:
         
         # Technology - Show ALL technologies (no category filter)
         st.markdown("**🔧 Technology**")
-        all_techs = [tech['name'] for tech in self.db.get_all_tech_stack()]
+        all_techs = [tech['name'] for tech in CachedQueryService.get_all_tech_stack(self.db)]
         if all_techs:
             technology = st.selectbox(
                 "technology_dropdown",
@@ -263,8 +269,7 @@ class DropdownManager:
         # Work Item - Show ALL work items (no technology filter) 
         st.markdown("**📋 Work Item**")
         all_work_items = []
-        all_techs_list = [tech['name'] for tech in self.db.get_all_tech_stack()]
-        for tech in all_techs_list:
+        for tech in all_techs:
             all_work_items.extend(self.db.get_work_items_by_technology(tech))
         all_work_items = sorted(list(set(all_work_items)))
         
@@ -283,7 +288,7 @@ class DropdownManager:
         # Skill/Topic - Show ALL skills (no work item filter)
         st.markdown("**🎯 Skill / Topic**")
         all_skills = []
-        for tech in all_techs_list:
+        for tech in all_techs:
             work_items_for_tech = self.db.get_work_items_by_technology(tech)
             for wi in work_items_for_tech:
                 all_skills.extend(self.db.get_skills_by_work_item(wi))
@@ -0,0 +1,24 @@
+"""
+Navigation helpers - Page switching through widget callbacks.
+Callbacks run before the click's rerun, so the new page renders in that same
+pass instead of needing a second, forced st.rerun().
+"""
+
+import streamlit as st
+
+HOME_PAGE = "home_v2"
+
+
+def go_to(page: str):
+    """Widget callback: make `page` the current page."""
+    st.session_state.current_page = page
+
+
+def set_state(key: str, value):
+    """Widget callback: store `value` under `key` in session state."""
+    st.session_state[key] = value
+
+
+def back_to_home_button(help: str = "Return to main page"):
+    """Render the standard '← Back to Home' button."""
+    st.button("← Back to Home", help=help, on_click=go_to, args=(HOME_PAGE,))